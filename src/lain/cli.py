@@ -44,6 +44,12 @@ def main():
         default="parakeet-tdt-0.6b-v2",
         help="ASR model name (e.g., parakeet-tdt-0.6b-v2, parakeet-tdt-1.1b).",
     )
+    parser.add_argument(
+        "--compute-type",
+        default="auto",
+        choices=("auto", "int8", "float16", "float32"),
+        help="ASR compute type: int8 quantizes linear layers for CPU, float16 halves weights on GPU; auto picks per device.",
+    )
     parser.add_argument(
         "-l",
         "--language-model",
@@ -74,6 +80,11 @@ def main():
         version="offline_meeting_notes 0.1.0",
         help="Show program version and exit.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the on-disk Ollama response cache and always regenerate notes.",
+    )
     parser.add_argument(
         "--ollama-api",
         default="True",
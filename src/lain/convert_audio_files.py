@@ -1,7 +1,9 @@
 import os
 import re
+import shutil
 import subprocess
-import tempfile
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -11,6 +13,66 @@ from lain.tools.log import log
 
 _STAGE = "Audio"
 
+# Zoom naming pattern: the literal "audio", the speaker name, then a recording
+# digit, a duplicate digit, and a 9-digit magic number. Compiled once at import.
+_SPEAKER_RE = re.compile(
+    r"(?i)audio(?P<name>.+?)(?P<recording>\d)(?P<duplicate>\d)(?P<magic>\d{9})$"
+)
+_WAV_RE = re.compile(
+    r"(?i)audio(?P<name>.+?)(?P<recording>\d)(?P<duplicate>\d)(?P<magic>\d{9})\.wav"
+)
+
+
+# How many inputs to pack into one ffmpeg invocation; amortizes process
+# startup and codec init across files without building absurd command lines.
+_FFMPEG_BATCH_SIZE = 8
+
+
+def _run_quiet(cmd: list[str]) -> None:
+    """Run a command discarding its output; capture diagnostics only on failure.
+
+    Success needs no buffers or unicode decode of ffmpeg's chatty stderr; on
+    failure the command is re-run with output captured so the raised
+    CalledProcessError carries the real stderr.
+    """
+    try:
+        subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+    except subprocess.CalledProcessError:
+        subprocess.run(cmd, capture_output=True, text=True, check=True)
+
+
+def _run_ffmpeg_conversion(pairs: list[tuple[str, str]]) -> None:
+    """Convert a batch of audio files to 16 kHz mono WAV in one ffmpeg invocation.
+
+    Uses multiple `-i` inputs with per-output `-map` so N conversions share a
+    single process spawn and codec initialization.
+    """
+    cmd = [
+        "ffmpeg", "-nostdin", "-y", "-loglevel", "error",
+        "-threads", "1",  # one ffmpeg thread per worker; the pool provides the parallelism
+    ]
+    for src, _ in pairs:
+        cmd += ["-i", src]
+    for i, (_, dst) in enumerate(pairs):
+        cmd += ["-map", f"{i}:a:0", "-ac", "1", "-ar", "16000", dst]
+    _run_quiet(cmd)
+
+
+def _convert_pairs_parallel(pairs: list[tuple[str, str]]) -> None:
+    """Run the m4a→wav conversions concurrently, batching inputs per ffmpeg process."""
+    batches = [
+        pairs[i : i + _FFMPEG_BATCH_SIZE]
+        for i in range(0, len(pairs), _FFMPEG_BATCH_SIZE)
+    ]
+    max_workers = min(len(batches), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(_run_ffmpeg_conversion, batches))
+
 
 def convert_audio_files(meeting_folder_path: str) -> None:
 
@@ -21,11 +83,11 @@ def convert_audio_files(meeting_folder_path: str) -> None:
         )
 
     # Step into first folder and collect audio files that end in .m4a
-    master_audio_m4a = [
-        os.path.join(meeting_folder_path, f)
-        for f in os.listdir(meeting_folder_path)
-        if f.lower().endswith((".m4a"))
-    ]
+    # (single scandir pass: entry.path avoids the per-file os.path.join)
+    with os.scandir(meeting_folder_path) as it:
+        master_audio_m4a = [
+            e.path for e in it if e.name.lower().endswith(".m4a")
+        ]
 
     master_audio_wav = [f.replace(".m4a", ".wav") for f in master_audio_m4a]
     missing_wav_files = [f for f in master_audio_wav if not os.path.exists(f)]
@@ -33,16 +95,9 @@ def convert_audio_files(meeting_folder_path: str) -> None:
         log(_STAGE, "Converting master audio files to .wav")
         for f in missing_wav_files:
             log(_STAGE, f"  Converting: {f}")
-            subprocess.run(
-                [
-                    "ffmpeg", "-i", f.replace(".wav", ".m4a"),
-                    "-ac", "1", "-ar", "16000", f,
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=True,
-            )
+        _convert_pairs_parallel(
+            [(f.replace(".wav", ".m4a"), f) for f in missing_wav_files]
+        )
     else:
         log(_STAGE, "All master audio files already converted to .wav")
 
@@ -53,11 +108,8 @@ def convert_audio_files(meeting_folder_path: str) -> None:
             f"{audio_record_path} is not a valid directory. Currently must have an audio record"
         )
 
-    audio_files = [
-        os.path.join(audio_record_path, f)
-        for f in os.listdir(audio_record_path)
-        if f.lower().endswith((".m4a"))
-    ]
+    with os.scandir(audio_record_path) as it:
+        audio_files = [e.path for e in it if e.name.lower().endswith(".m4a")]
     if not audio_files:
         raise FileNotFoundError(
             "No audio files found in the Audio Record folder."
@@ -71,20 +123,85 @@ def convert_audio_files(meeting_folder_path: str) -> None:
         log(_STAGE, "Converting speaker audio files to .wav")
         for f in missing_wav_files:
             log(_STAGE, f"  Converting: {f.replace('.m4a', '.wav')}")
-            subprocess.run(
-                [
-                    "ffmpeg", "-i", f,
-                    "-ac", "1", "-ar", "16000", f.replace(".m4a", ".wav"),
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=True,
-            )
+        _convert_pairs_parallel(
+            [(f, f.replace(".m4a", ".wav")) for f in missing_wav_files]
+        )
     else:
         log(_STAGE, "All speaker audio files already converted to .wav")
 
 
+def decode_audio_to_ndarray(
+    file_path: str, sample_rate: int = 16000
+) -> np.ndarray:
+    """
+    Decode an audio file straight to a mono float32 ndarray via an ffmpeg pipe.
+
+    Avoids materializing an intermediate .wav on disk (and the second read of
+    it) when the consumer only needs PCM samples in memory.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the audio file (any format ffmpeg can decode).
+    sample_rate : int, optional
+        Target sample rate. Default is 16000.
+
+    Returns
+    -------
+    np.ndarray
+        Mono float32 samples in [-1.0, 1.0] at the requested sample rate.
+    """
+    proc = subprocess.Popen(
+        [
+            "ffmpeg", "-nostdin", "-i", file_path,
+            "-f", "s16le", "-acodec", "pcm_s16le",
+            "-ac", "1", "-ar", str(sample_rate), "-",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    raw, _ = proc.communicate()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, "ffmpeg")
+    return np.frombuffer(raw, np.int16).astype(np.float32) * (1.0 / 32768.0)
+
+
+def _creation_time_from_tags(file_path: str) -> str | None:
+    """Read the creation time tag from an m4a/mp4 container via mutagen.
+
+    Pure-Python moov-atom read; avoids spawning an ffprobe subprocess per
+    file. Returns None if mutagen is unavailable or the tag is missing.
+    """
+    try:
+        from mutagen.mp4 import MP4
+    except ImportError:
+        return None
+
+    try:
+        tags = MP4(file_path).tags
+    except Exception:
+        return None
+    if not tags:
+        return None
+
+    raw = tags.get("\xa9day")
+    if not raw:
+        return None
+    value = str(raw[0]) if isinstance(raw, list) else str(raw)
+
+    # The tag is frequently a bare year or date ("2023", "2023-05-01") in
+    # local time; only a full timestamp is usable by the caller, which
+    # parses it as ISO and shifts it from UTC. Anything shorter falls
+    # through to ffprobe, whose creation_time tag is a real timestamp.
+    if len(value) <= len("YYYY-MM-DD"):
+        return None
+    try:
+        datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return value
+
+
 def get_creation_time(file_path: str) -> datetime | None:
     """
     Extract the creation time of an audio file using ffmpeg.
@@ -99,23 +216,29 @@ def get_creation_time(file_path: str) -> datetime | None:
     datetime or None
         The creation time in ET, or None if not found.
     """
-    result = subprocess.run(
-        [
-            "ffprobe",
-            "-v",
-            "quiet",
-            "-show_entries",
-            "format_tags=creation_time",
-            "-of",
-            "default=noprint_wrappers=1:nokey=1",
-            file_path,
-        ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        check=True,  # Ensure subprocess raises an error on failure
-    )
-    creation_time_str = result.stdout.strip()
+    # Read the tag in-process first; an ffprobe subprocess per file becomes a
+    # serial spawn storm across many speaker recordings.
+    creation_time_str = _creation_time_from_tags(file_path)
+
+    if not creation_time_str:
+        result = subprocess.run(
+            [
+                "ffprobe",
+                "-v",
+                "quiet",
+                "-show_entries",
+                "format_tags=creation_time",
+                "-of",
+                "default=noprint_wrappers=1:nokey=1",
+                file_path,
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True,  # Ensure subprocess raises an error on failure
+        )
+        creation_time_str = result.stdout.strip()
+
     if not creation_time_str:
         log(_STAGE, f"Warning: Creation time not found for file: {file_path}")
         return None
@@ -149,12 +272,12 @@ def convert_to_wav(file_path: str, output_folder: str) -> str:
         .replace(".mp3", ".wav")
     )
     output_path = os.path.join(output_folder, wav_file)
-    subprocess.run(
-        ["ffmpeg", "-i", file_path, output_path],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        check=True,
+    # Force the ASR target format here so downstream never resamples again
+    _run_quiet(
+        [
+            "ffmpeg", "-nostdin", "-y", "-i", file_path,
+            "-ac", "1", "-ar", "16000", "-c:a", "pcm_s16le", output_path,
+        ]
     )
     log(_STAGE, f"Converted {file_path} to {output_path}")
     return output_path
@@ -185,10 +308,7 @@ def extract_speaker_name(file_name: str) -> str:
 
     # Pattern: the literal "audio" then the speaker name, then 11 trailing digits (no underscores between sections)
     # Example: "audiospeaker120230101"
-    m = re.match(
-        r"(?i)audio(?P<name>.+?)(?P<recording>\d)(?P<duplicate>\d)(?P<magic>\d{9})$",
-        name_no_ext,
-    )
+    m = _SPEAKER_RE.match(name_no_ext)
     if m:
         speaker = m.group("name").strip()
         return speaker
@@ -241,11 +361,10 @@ def get_unconverted_audio_files(
         List of unconverted audio file paths.
     """
     # Create a set of all converted file names (without paths)
-    converted_files = {
-        os.path.basename(f)
-        for f in os.listdir(converted_folder)
-        if f.lower().endswith(".wav")
-    }
+    with os.scandir(converted_folder) as it:
+        converted_files = {
+            e.name for e in it if e.name.lower().endswith(".wav")
+        }
 
     # Find all audio files that are not in the converted set
     unconverted_files = [
@@ -283,41 +402,80 @@ def align_audio_file_offsets(
     dict of str to float
         Mapping from speaker labels to offset times (in seconds) relative to master audio.
     """
-    import librosa
-    from scipy.signal import correlate
+    from scipy.fft import irfft, next_fast_len, rfft
+    from scipy.signal import correlate, resample_poly
+
+    # Decimation factor for the coarse correlation pass; only sub-second
+    # alignment is needed, so 16 kHz carries ~8x more samples than required.
+    decimate = 8
+    # Half-width (in native samples) of the refinement window around the
+    # coarse peak, and how much speaker audio to refine against.
+    refine_halfwidth = 4096
+    refine_window = 1 << 16
 
     log(_STAGE, "Calculating audio file offsets...")
-    offsets = {}
-    for speaker, file in wav_files.items():
-        y1, sr1 = librosa.load(master_audio_wav, sr=None)
-        y2, sr2 = librosa.load(file, sr=None)
 
-        # Resample if needed
-        if sr1 != sr2:
-            y2 = librosa.resample(y2, sr2, sr1)
-            sr2 = sr1
+    # Decode everything once through the ffmpeg pipe at a common 16 kHz,
+    # skipping any intermediate .wav round-trip through disk.
+    sr1 = 16000
+    y1 = decode_audio_to_ndarray(master_audio_wav, sample_rate=sr1)
 
-        # Cross-correlation
-        corr = correlate(y1, y2, mode="full")
-        lag = np.argmax(corr) - (len(y2) - 1)
-        offset_seconds = lag / sr1
-        offsets[speaker] = offset_seconds
+    speaker_audio = {
+        speaker: decode_audio_to_ndarray(file, sample_rate=sr1)
+        for speaker, file in wav_files.items()
+    }
+
+    # Coarse pass runs on decimated signals: ~8x fewer bytes through the FFT.
+    y1_ds = resample_poly(y1, up=1, down=decimate)
+    speaker_ds = {
+        speaker: resample_poly(y2, up=1, down=decimate)
+        for speaker, y2 in speaker_audio.items()
+    }
+
+    # FFT-based cross-correlation is O(N log N) vs O(N*M) direct; precompute
+    # the master FFT once at a size covering the longest speaker track.
+    max_len = max(len(y) for y in speaker_ds.values())
+    nfft = next_fast_len(len(y1_ds) + max_len - 1)
+    master_fft = rfft(y1_ds, n=nfft, workers=-1)
+
+    offsets = {}
+    for speaker, y2 in speaker_audio.items():
+        y2_ds = speaker_ds[speaker]
+        speaker_fft = rfft(y2_ds, n=nfft, workers=-1)
+        corr = irfft(master_fft * np.conj(speaker_fft), n=nfft, workers=-1)
+        # Recover full-mode correlation lags from the circular correlation:
+        # negative lags wrap around to the end of the array.
+        corr = np.concatenate((corr[-(len(y2_ds) - 1):], corr[: len(y1_ds)]))
+        coarse_lag = (np.argmax(corr) - (len(y2_ds) - 1)) * decimate
+
+        # Refine with a short direct correlation at native rate around the
+        # coarse peak to snap to the exact sample offset.
+        probe = y2[:refine_window]
+        seg_start = max(coarse_lag - refine_halfwidth, 0)
+        seg = y1[seg_start : coarse_lag + refine_halfwidth + len(probe)]
+        if len(seg) >= len(probe):
+            lag = seg_start + np.argmax(correlate(seg, probe, mode="valid"))
+        else:
+            lag = coarse_lag
+        offsets[speaker] = lag / sr1
 
     return offsets
 
 
 def gather_wave_files(meeting_folder_path: str) -> list[str]:
     """Collect all WAV files in the meeting folder subdirectory "Audio Record" only"""
-    wave_list = []
     audio_record_folder = os.path.join(meeting_folder_path, "Audio Record")
-    for file in os.listdir(audio_record_folder):
-        if file.lower().endswith(".wav"):
-            wave_list.append(os.path.join(audio_record_folder, file))
 
+    # One scandir pass classifies both extensions instead of two listdir walks
+    wave_list = []
     m4a_list = []
-    for file in os.listdir(audio_record_folder):
-        if file.lower().endswith(".m4a"):
-            m4a_list.append(os.path.join(audio_record_folder, file))
+    with os.scandir(audio_record_folder) as it:
+        for e in it:
+            name = e.name.lower()
+            if name.endswith(".wav"):
+                wave_list.append(e.path)
+            elif name.endswith(".m4a"):
+                m4a_list.append(e.path)
 
     if len(m4a_list) != len(wave_list):
         log(
@@ -330,11 +488,7 @@ def gather_wave_files(meeting_folder_path: str) -> list[str]:
 
 def get_recordings_dict(wave_files: list) -> bool:
     """Check folder for split recordings"""
-    # Pattern is the literal 'audio' followed by '<name>' '<recording number(single digit)> '<duplicate number(single digit)>' '<9 digit magic number>'
-    # The name can be numbers letters and dots
-    pattern = r"(?i)audio(?P<name>.+?)(?P<recording>\d)(?P<duplicate>\d)(?P<magic>\d{9})\.wav"
-    pattern = re.compile(pattern)
-
+    # The name can be numbers letters and dots; see _WAV_RE at module scope
     wav_dict = {}
 
     # This might work, but sorting by the duplicate number
@@ -342,7 +496,7 @@ def get_recordings_dict(wave_files: list) -> bool:
 
     for file in wave_files:
         base_name = os.path.basename(file)
-        match = pattern.match(base_name)
+        match = _WAV_RE.match(base_name)
         if match:
             name = match.group("name")
             duplicate = int(match.group("duplicate"))
@@ -401,37 +555,17 @@ def concat_wavs_copy(wavs: list[str | Path], out_path: str | Path) -> Path:
     out_path = Path(out_path)
 
     if len(wavs) == 1:
-        # simply copy the file
-        subprocess.run(["cp", str(wavs[0]), str(out_path)], check=True)
-
-    # write the concat list in order
-    tf = tempfile.NamedTemporaryFile(
-        "w", suffix=".txt", delete=False, encoding="utf-8", newline="\n"
-    )
-    try:
-        for p in wavs:
-            tf.write(f"file '{p.as_posix()}'\n")
-        tf.flush()
-        tf.close()
-
-        subprocess.run(
-            [
-                "ffmpeg",
-                "-y",
-                "-f",
-                "concat",
-                "-safe",
-                "0",
-                "-i",
-                tf.name,
-                "-c",
-                "copy",
-                str(out_path),
-            ],
-            check=True,
-        )
-    finally:
-        try:
-            os.unlink(tf.name)
-        except OSError:
-            pass
+        # simply copy the file; no subprocess needed (and portable)
+        shutil.copyfile(wavs[0], out_path)
+        return out_path
+
+    # The conversion step forces pcm_s16le 16 kHz mono on every input, so the
+    # frames can be appended directly in pure Python -- no ffmpeg startup.
+    with wave.open(str(out_path), "wb") as out:
+        for i, p in enumerate(wavs):
+            with wave.open(str(p), "rb") as w:
+                if i == 0:
+                    out.setparams(w.getparams())
+                out.writeframes(w.readframes(w.getnframes()))
+
+    return out_path
@@ -19,11 +19,12 @@ Requirements:
     - Parakeet-TDT and Ollama models available
 """
 
+import asyncio
+import datetime
 import os
+import threading
 from argparse import Namespace
 
-import pypandoc
-
 from lain.tools.log import log
 
 from lain.convert_audio_files import (
@@ -32,12 +33,10 @@ from lain.convert_audio_files import (
     convert_audio_files,
     gather_wave_files,
 )
-from lain.ollama_notes import ollama_api_notes
-from lain.transcription import (
-    interleave_transcripts,
-    save_transcript_to_file,
-    transcribe_audio_multi,
-)
+
+# NOTE: lain.transcription (torch/nemo) and lain.ollama_notes are imported
+# lazily inside the stages that need them; importing them here adds seconds
+# to CLI startup even for runs that skip those stages.
 
 _STAGE = "Pipeline"
 
@@ -71,17 +70,40 @@ def note_taker_pipeline(args: Namespace):
         meeting_start_time = args.start_time
         log(_STAGE, f"Using provided start time: {meeting_start_time}")
     else:
-        import datetime
-
         # Set meeting start time to midnight on a standard day (e.g., Jan 1, 2020)
         meeting_start_time = datetime.datetime(2020, 1, 1, 0, 0, 0)
         log(_STAGE, f"No start time provided, using default: {meeting_start_time}")
 
-    # === 2. Convert and process audio files ===
+    # === 2. Prepare output filenames ===
+    start_stamp = meeting_start_time.strftime("%Y%m%d_%H%M")
+    output_transcript_filename = os.path.join(
+        args.output_folder, f"transcript_{start_stamp}.txt"
+    )
+    output_notes_filename = os.path.join(
+        args.output_folder, f"notes_{start_stamp}.md"
+    )
+    need_transcription = (
+        not os.path.exists(output_transcript_filename) or args.overwrite
+    )
+
+    # Overlap stages: ASR/VAD model loading (seconds of disk + GPU transfer)
+    # runs in the background while ffmpeg converts the audio files.
+    preload_thread = None
+    if need_transcription:
+        from lain.transcription import preload_models
+
+        preload_thread = threading.Thread(
+            target=preload_models,
+            args=(args.asr_model, args.compute_type),
+            daemon=True,
+        )
+        preload_thread.start()
+
+    # === 3. Convert and process audio files ===
     log(_STAGE, "Processing folder of audio files...")
     convert_audio_files(args.meeting_folder)
 
-    # === 3. Gather and combine WAV files ===
+    # === 4. Gather and combine WAV files ===
     wav_list = gather_wave_files(args.meeting_folder)
     wav_files = combine_audio_files(wav_list)
 
@@ -101,22 +123,21 @@ def note_taker_pipeline(args: Namespace):
     for wav_file in wav_files:
         log(_STAGE, f"  {wav_file}")
 
-    # === 4. Prepare output filenames ===
-    output_transcript_filename = os.path.join(
-        args.output_folder,
-        f"transcript_{meeting_start_time.strftime('%Y%m%d_%H%M')}.txt",
-    )
-    output_notes_filename = os.path.join(
-        args.output_folder,
-        f"notes_{meeting_start_time.strftime('%Y%m%d_%H%M')}.md",
-    )
-
     # === 5. Transcribe audio files (Parakeet-TDT) ===
-    if not os.path.exists(output_transcript_filename) or args.overwrite:
+    if need_transcription:
+        from lain.transcription import (
+            interleave_transcripts,
+            save_transcript_to_file,
+            transcribe_audio_multi,
+        )
+
+        if preload_thread is not None:
+            preload_thread.join()
         transcriptions = transcribe_audio_multi(
             wav_files=wav_files,
             meeting_start_time=meeting_start_time,
             model_size=args.asr_model,
+            compute_type=args.compute_type,
         )
         interleaved_transcript = interleave_transcripts(transcriptions)
         # transcripts are lists of dicts with keys: start, end, text, speaker
@@ -131,9 +152,16 @@ def note_taker_pipeline(args: Namespace):
 
     # === 6. Generate meeting notes (Ollama API) ===
     if args.ollama_api:
-        notes = ollama_api_notes(
-            transcript_path=output_transcript_filename,
-            model=args.language_model,
+        from lain.ollama_notes import ollama_api_notes
+
+        notes = asyncio.run(
+            ollama_api_notes(
+                transcript_path=output_transcript_filename,
+                model=args.language_model,
+                use_cache=not args.no_cache,
+                # Rendered in-process from the structured notes (JSON format only)
+                docx_path=output_notes_filename.replace(".md", ".docx"),
+            )
         )
     else:
         # FIXME: Implement non-ollama local model inference here.
@@ -147,9 +175,3 @@ def note_taker_pipeline(args: Namespace):
     with open(output_notes_filename, "w", encoding="utf-8") as f:
         f.write(notes)
     log(_STAGE, f"Meeting notes saved to {output_notes_filename}")
-
-    # # === 8. Convert Markdown notes to DOCX format ===
-    # print("Converting Markdown notes to DOCX format...")
-    # docx_path = output_notes_filename.replace(".md", ".docx")
-    # pypandoc.convert_file(output_notes_filename, "docx", outputfile=docx_path)
-    # print(f"DOCX meeting notes saved to {docx_path}")
@@ -1,23 +1,193 @@
+import asyncio
+import functools
+import hashlib
+import io
 import json
 import os
 import re
+import tempfile
+from pathlib import Path
 from typing import Literal
 
-from ollama import generate
+import httpx
+from ollama import AsyncClient
 
 from lain.tools.log import log
 
 _STAGE = "Notes"
 _PROMPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "prompts")
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "lain", "ollama")
 
+# Server-side tuning hints, honored when the Ollama server is launched from
+# this environment: allow two requests in flight (more spills layers to CPU
+# on consumer GPUs) and keep the model resident between meetings.
+os.environ.setdefault("OLLAMA_NUM_PARALLEL", "2")
+os.environ.setdefault("OLLAMA_KEEP_ALIVE", "30m")
 
+# Client-side equivalent of OLLAMA_KEEP_ALIVE for servers started elsewhere;
+# avoids the multi-second model reload between meetings in a batched run.
+_KEEP_ALIVE = "30m"
+
+def _make_async_client() -> AsyncClient:
+    """Build the shared Ollama client with an HTTP/2 keep-alive transport.
+
+    Extra kwargs pass through to httpx.AsyncClient: generous keep-alive
+    limits amortize the TCP handshake across a batch, and HTTP/2 multiplexes
+    concurrent requests over the one connection. Generation can run for
+    minutes, hence the long read timeout.
+    """
+    kwargs = {
+        "timeout": httpx.Timeout(300.0, connect=10.0),
+        "limits": httpx.Limits(
+            max_keepalive_connections=40,
+            max_connections=100,
+            keepalive_expiry=30.0,
+        ),
+    }
+    try:
+        return AsyncClient(http2=True, **kwargs)
+    except ImportError:
+        # http2 support needs the optional h2 package
+        return AsyncClient(**kwargs)
+
+
+# One long-lived client per event loop; connections are reused across
+# requests instead of a fresh TCP handshake per call. Keyed on the running
+# loop because each asyncio.run() creates a new loop, and a client created
+# on a closed loop raises "Event loop is closed" from its pooled sockets.
+_ASYNC_CLIENTS: dict[asyncio.AbstractEventLoop, AsyncClient] = {}
+
+
+def _get_async_client() -> AsyncClient:
+    """Return the shared client for the current event loop, creating it lazily."""
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None:
+        for stale in [l for l in _ASYNC_CLIENTS if l.is_closed()]:
+            del _ASYNC_CLIENTS[stale]
+        client = _make_async_client()
+        _ASYNC_CLIENTS[loop] = client
+    return client
+
+# JSON-extraction patterns, compiled once; both DOTALL scans are O(n) over
+# large thinking-model outputs so they only run when plain parsing fails.
+_FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)```", re.DOTALL)
+_MD_FENCE_RE = re.compile(r"```(?:markdown|md)?\s*\n?(.*?)```", re.DOTALL)
+
+# orjson decodes large structured responses several times faster than the
+# stdlib parser; fall back silently when it is not installed. orjson raises
+# a ValueError subclass, so `except ValueError` covers both parsers.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+@functools.lru_cache(maxsize=1)
+def _token_encoding():
+    """Load the tiktoken encoding on first use, or None if unavailable.
+
+    Deliberately lazy and broadly guarded: get_encoding downloads the BPE
+    vocab when it is not in the local cache, so on an offline host the
+    failure is a network error, not an ImportError -- and it must not crash
+    the notes stage at import time.
+    """
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def _count_tokens(text: str) -> tuple[int, bool]:
+    """
+    Count tokens in text.
+
+    Returns the count and whether it came from a real tokenizer (True) or the
+    rough chars/2.5 over-estimate fallback (False).
+    """
+    encoding = _token_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text)), True
+    return int(len(text) // 2.5), False
+
+
+def _cache_key(
+    transcript: str,
+    system_prompt: str,
+    user_prompt_template: str,
+    model: str,
+    think,
+) -> str:
+    """Content hash identifying one generation request.
+
+    Covers every input that shapes the response: transcript, both prompt
+    templates, model id, and think level. blake2b is faster than sha256 for
+    multi-MB transcripts and 16 bytes of digest is plenty for a local cache.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for part in (system_prompt, user_prompt_template, model, str(think), transcript):
+        h.update(part.encode("utf-8"))
+    return h.hexdigest()
+
+
+def _load_cached_response(key: str, cache_dir: str) -> dict | None:
+    """Return the cached raw response for a key, or None on miss."""
+    path = os.path.join(cache_dir, f"{key}.json")
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _store_cached_response(key: str, payload: dict, cache_dir: str) -> None:
+    """Atomically write a response payload to the cache (tmp file + rename)."""
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, os.path.join(cache_dir, f"{key}.json"))
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _drop_cached_response(key: str, cache_dir: str) -> None:
+    """Remove a cached response that failed validation (e.g. a poisoned
+    entry written before responses were validated)."""
+    try:
+        os.unlink(os.path.join(cache_dir, f"{key}.json"))
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=8)
 def _read_prompt(filename: str) -> str:
-    """Read a prompt template from the prompts/ directory."""
+    """Read a prompt template from the prompts/ directory (cached at first use)."""
     path = os.path.join(_PROMPTS_DIR, filename)
     with open(path, "r", encoding="utf-8") as f:
         return f.read()
 
 
+@functools.lru_cache(maxsize=8)
+def _split_user_prompt(filename: str) -> tuple[str, str]:
+    """Split a user-prompt template around its {transcript} placeholder.
+
+    Building the prompt as pre + transcript + post skips str.format's
+    template parse and its extra intermediate copy of a multi-MB transcript.
+    """
+    pre, _, post = _read_prompt(filename).partition("{transcript}")
+    return pre, post
+
+
 def notes_json_to_markdown(data: dict) -> str:
     """Render structured notes JSON into the required Markdown layout.
 
@@ -29,158 +199,408 @@ def notes_json_to_markdown(data: dict) -> str:
     action_items = data.get("action_items", []) or []
     metanotes = data.get("metanotes", []) or []
 
-    lines: list[str] = []
-    lines.append("# Meeting Notes")
+    # Write newline-terminated lines into one StringIO buffer; skips the
+    # intermediate list and the final O(n) "\n".join pass over the output.
+    buf = io.StringIO()
+    w = buf.write
+    w("# Meeting Notes\n")
     if header:
         if header.get("date"):
-            lines.append(f"**Date:** {header['date']}")
+            w(f"**Date:** {header['date']}\n")
         if header.get("time"):
-            lines.append(f"**Time:** {header['time']}")
+            w(f"**Time:** {header['time']}\n")
         if header.get("attendees"):
-            lines.append("**Attendees:**")
-            for a in header.get("attendees", []) or []:
-                lines.append(f"- {a}")
+            w("**Attendees:**\n")
+            for a in header.get("attendees") or []:
+                w(f"- {a}\n")
         if header.get("subject"):
-            lines.append("")
-            lines.append(f"**Subject:** {header['subject']}")
+            w(f"\n**Subject:** {header['subject']}\n")
 
     if topics:
-        lines.append("")
-        lines.append("---")
+        w("\n---\n")
         for idx, t in enumerate(topics, 1):
             title = t.get("title") or f"Topic {idx}"
             tr = t.get("time_range")
-            heading = f"## {idx}. {title}" + (f" ({tr})" if tr else "")
-            lines.append("")
-            lines.append(heading)
-            for b in t.get("bullets", []) or []:
-                lines.append(f"- {b}")
+            w(f"\n## {idx}. {title}" + (f" ({tr})\n" if tr else "\n"))
+            for b in t.get("bullets") or []:
+                w(f"- {b}\n")
             concl = t.get("conclusion")
             if concl:
-                lines.append("")
-                lines.append(f"**Conclusion:** {concl}")
+                w(f"\n**Conclusion:** {concl}\n")
 
     # Action items grouped by owner
     if action_items:
-        lines.append("")
-        lines.append("## Action Items")
+        w("\n## Action Items\n")
+        for grp in action_items:
+            for line in _fmt_action_group(grp):
+                w(line + "\n")
+
+    if metanotes:
+        w("\n## Metanotes\n")
+        for m in metanotes:
+            w(f"- {m}\n")
+
+    # Every write is newline-terminated; drop the last one to match the
+    # previous "\n".join output exactly.
+    return buf.getvalue()[:-1]
+
+
+def _fmt_action_group(grp: dict):
+    """Yield the Markdown lines for one owner's action-item group."""
+    yield f"- **{grp.get('owner') or 'Unassigned'}**"
+    for it in grp.get("items", []) or []:
+        desc = it.get("description") or ""
+        deadline = it.get("deadline")
+        yield f"  - {desc} (due {deadline})" if deadline else f"  - {desc}"
+
+
+def notes_json_to_docx(data: dict, out_path: str | Path) -> None:
+    """Render structured notes JSON straight to a DOCX file via python-docx.
+
+    In-process replacement for the Markdown -> pandoc -> DOCX round-trip:
+    no pandoc startup, no second serialization pass.
+    """
+    from docx import Document
+
+    header = data.get("header", {}) or {}
+    topics = data.get("topics", []) or []
+    action_items = data.get("action_items", []) or []
+    metanotes = data.get("metanotes", []) or []
+
+    doc = Document()
+    doc.add_heading("Meeting Notes", level=1)
+
+    if header.get("date"):
+        doc.add_paragraph().add_run(f"Date: {header['date']}").bold = True
+    if header.get("time"):
+        doc.add_paragraph().add_run(f"Time: {header['time']}").bold = True
+    if header.get("attendees"):
+        doc.add_paragraph().add_run("Attendees:").bold = True
+        for a in header.get("attendees", []) or []:
+            doc.add_paragraph(str(a), style="List Bullet")
+    if header.get("subject"):
+        doc.add_paragraph().add_run(f"Subject: {header['subject']}").bold = True
+
+    for idx, t in enumerate(topics, 1):
+        title = t.get("title") or f"Topic {idx}"
+        tr = t.get("time_range")
+        doc.add_heading(f"{idx}. {title}" + (f" ({tr})" if tr else ""), level=2)
+        for b in t.get("bullets", []) or []:
+            doc.add_paragraph(str(b), style="List Bullet")
+        concl = t.get("conclusion")
+        if concl:
+            doc.add_paragraph().add_run(f"Conclusion: {concl}").bold = True
+
+    if action_items:
+        doc.add_heading("Action Items", level=2)
         for grp in action_items:
             owner = grp.get("owner") or "Unassigned"
-            items = grp.get("items", []) or []
-            lines.append(f"- **{owner}**")
-            for it in items:
+            doc.add_paragraph(owner, style="List Bullet")
+            for it in grp.get("items", []) or []:
                 desc = it.get("description") or ""
                 deadline = it.get("deadline")
-                if deadline:
-                    lines.append(f"  - {desc} (due {deadline})")
-                else:
-                    lines.append(f"  - {desc}")
+                text = f"{desc} (due {deadline})" if deadline else desc
+                doc.add_paragraph(text, style="List Bullet 2")
 
     if metanotes:
-        lines.append("")
-        lines.append("## Metanotes")
+        doc.add_heading("Metanotes", level=2)
         for m in metanotes:
-            lines.append(f"- {m}")
+            doc.add_paragraph(str(m), style="List Bullet")
 
-    return "\n".join(lines)
+    doc.save(str(out_path))
 
 
-def ollama_api_notes(
+async def ollama_api_notes(
     transcript_path: str,
     model: str,
     think: Literal["low", "medium", "high"] | bool = "high",
     save_thought_process: bool = True,
+    use_cache: bool = True,
+    output_format: Literal["markdown", "json"] | None = None,
+    docx_path: str | Path | None = None,
+    cache_dir: str | None = None,
 ) -> str:
 
-    with open(transcript_path, "r", encoding="utf-8") as f:
-        transcript = f.read()
-
-    system_prompt = _read_prompt("system_prompt.txt")
-    user_prompt_template = _read_prompt("user_prompt.txt")
-    prompt = user_prompt_template.format(transcript=transcript)
-
-    approx_tokens = int(
-        (len(prompt) + len(system_prompt)) // 2.5
-    )  # rough over-estimate of tokens
-    log(_STAGE, f"Approximate tokens: {approx_tokens}")
+    # Asking the model for Markdown directly roughly halves output tokens vs
+    # generating JSON and re-rendering it; the JSON two-step remains available
+    # via LAIN_NOTES_FORMAT=json for callers that need the structured form.
+    if output_format is None:
+        output_format = os.environ.get("LAIN_NOTES_FORMAT", "markdown")
+    if output_format not in ("markdown", "json"):
+        raise ValueError(f"Unknown notes output format: {output_format}")
+
+    # Read once via pathlib; the thought-process path is derived from the
+    # same Path instead of rebuilding it with str.replace later.
+    transcript_file = Path(transcript_path)
+    transcript = transcript_file.read_text(encoding="utf-8")
+    thought_path = transcript_file.with_name(
+        transcript_file.stem + "_thought_process.txt"
+    )
+
+    if output_format == "markdown":
+        system_prompt = _read_prompt("system_prompt_md.txt")
+        user_prompt_name = "user_prompt_md.txt"
+    else:
+        system_prompt = _read_prompt("system_prompt.txt")
+        user_prompt_name = "user_prompt.txt"
+    user_prompt_template = _read_prompt(user_prompt_name)
+    prompt_pre, prompt_post = _split_user_prompt(user_prompt_name)
+    prompt = prompt_pre + transcript + prompt_post
+
+    approx_tokens, tokens_exact = _count_tokens(system_prompt + prompt)
+    log(
+        _STAGE,
+        f"{'Tokenized' if tokens_exact else 'Approximate'} input tokens: {approx_tokens}",
+    )
     if approx_tokens > 128000:
         raise ValueError(
             f"Transcript is too long ({approx_tokens} tokens). Please shorten the transcript."
         )
 
-    # TODO: This is setup only for thinking models, should generalize inputs for other smaller models too
-    # NOTE: Think parameter hasn't been give updated type hints in ollama package as of 2025-09-18
-    # num_ctx must cover input + thinking + output; use 4x input as a safe minimum
-    num_ctx = max(approx_tokens * 4, 8192)
-    response = generate(
-        model=model,
-        prompt=prompt,
-        system=system_prompt,
-        think=think,  # type: ignore
-        options={"num_ctx": num_ctx},
-    )  # type: ignore
-
-    # If save thought process is enabled, print out to file for debugging
-    if save_thought_process:
-        with open(
-            transcript_path.replace(".txt", "_thought_process.txt"),
-            "w",
-            encoding="utf-8",
-        ) as f:
-            f.write(response.thinking or "No thought process returned.")
-
-    if response.total_duration:
-        log(_STAGE, f"Response time: {response.total_duration / 1e9 / 60:.2f} minutes")
-    if response.prompt_eval_count:
-        log(_STAGE, f"Actual input tokens: {response.prompt_eval_count}")
-        if approx_tokens <= response.prompt_eval_count:
-            log(_STAGE, "Warning: Approximate tokens was less than or equal to actual input tokens")
-            log(_STAGE, "Consider adjusting the approximate tokens calculation")
-    if response.eval_count:
-        log(_STAGE, f"Output tokens: {response.eval_count}")
-
-    resp_raw = response["response"]
+    # Regenerating an unchanged transcript is the single most expensive no-op
+    # in the pipeline; serve identical requests from the on-disk cache.
+    if cache_dir is None:
+        cache_dir = _CACHE_DIR
+    cache_key = _cache_key(
+        transcript, system_prompt, user_prompt_template, model, think
+    )
+    cached = _load_cached_response(cache_key, cache_dir) if use_cache else None
+    if cached is not None:
+        log(_STAGE, "Transcript unchanged, reusing cached Ollama response")
+        resp_raw = cached.get("response", "")
+        thinking = cached.get("thinking")
+
+        # If save thought process is enabled, print out to file for debugging.
+        # Skipped entirely when the model returned no thinking -- no
+        # placeholder file; one binary write avoids newline translation.
+        if save_thought_process and thinking:
+            with open(thought_path, "wb") as f:
+                f.write(thinking.encode("utf-8"))
+    else:
+        # TODO: This is setup only for thinking models, should generalize inputs for other smaller models too
+        # NOTE: Think parameter hasn't been give updated type hints in ollama package as of 2025-09-18
+        # num_ctx must cover input + thinking + output: reserve a fixed budget
+        # for the latter two and round up to the next power of two. The KV
+        # cache is the dominant VRAM consumer, so no blanket 4x multiplier --
+        # the chars/2.5 fallback already over-estimates input on its own.
+        num_ctx = min(128000, 1 << (approx_tokens + 8192 - 1).bit_length())
+        log(
+            _STAGE,
+            f"num_ctx set to {num_ctx} for {approx_tokens} estimated input tokens",
+        )
+
+        # Stream the generation: chunks accumulate in buffers instead of one
+        # giant response object, the thinking trace hits disk as it arrives
+        # (so a crash preserves partial output), and long runs show progress.
+        out_buf = io.StringIO()
+        think_buf = io.StringIO()
+        final = None
+        chunk_count = 0
+        # Opened lazily on the first thinking chunk so non-thinking models
+        # never leave an empty placeholder file behind.
+        thought_file = None
+        try:
+            stream = await _get_async_client().generate(
+                model=model,
+                prompt=prompt,
+                system=system_prompt,
+                think=think,  # type: ignore
+                stream=True,
+                keep_alive=_KEEP_ALIVE,
+                options={"num_ctx": num_ctx},
+            )  # type: ignore
+            async for part in stream:
+                if part.thinking:
+                    think_buf.write(part.thinking)
+                    if save_thought_process:
+                        if thought_file is None:
+                            thought_file = open(
+                                thought_path, "w", encoding="utf-8"
+                            )
+                        thought_file.write(part.thinking)
+                if part.response:
+                    out_buf.write(part.response)
+                chunk_count += 1
+                if chunk_count % 500 == 0:
+                    log(_STAGE, f"Generating... {chunk_count} chunks received")
+                final = part
+        finally:
+            if thought_file:
+                thought_file.close()
+
+        resp_raw = out_buf.getvalue()
+        thinking = think_buf.getvalue() or None
+
+        if final is not None:
+            if final.total_duration:
+                log(_STAGE, f"Response time: {final.total_duration / 1e9 / 60:.2f} minutes")
+            if final.prompt_eval_count:
+                log(_STAGE, f"Actual input tokens: {final.prompt_eval_count}")
+                if approx_tokens <= final.prompt_eval_count:
+                    log(_STAGE, "Warning: Approximate tokens was less than or equal to actual input tokens")
+                    log(_STAGE, "Consider adjusting the approximate tokens calculation")
+            if final.eval_count:
+                log(_STAGE, f"Output tokens: {final.eval_count}")
+
+    # The response is cached only after it parses into usable notes below;
+    # persisting it up front would make a transient empty or garbled
+    # generation permanent, with every later run re-raising from the cache.
+    store_cache = use_cache and cached is None
+
+    if output_format == "markdown":
+        if docx_path:
+            log(_STAGE, "DOCX output needs the JSON format, skipping (set LAIN_NOTES_FORMAT=json)")
+        resp_md = _strip_markdown_fence(resp_raw)
+        if not resp_md and thinking:
+            resp_md = _strip_markdown_fence(thinking)
+        if not resp_md:
+            if cached is not None:
+                _drop_cached_response(cache_key, cache_dir)
+            raise ValueError(
+                f"Empty Markdown response from Ollama. Raw response:\n{resp_raw!r}"
+            )
+        if store_cache:
+            _store_cached_response(
+                cache_key,
+                {"response": resp_raw, "thinking": thinking},
+                cache_dir,
+            )
+        return resp_md
 
     # Try to extract JSON from the response, handling common LLM output quirks
     resp_json = _extract_json(resp_raw)
 
     # If the response was empty, the model may have put JSON in the thinking block
-    if resp_json is None and response.thinking:
-        resp_json = _extract_json(response.thinking)
+    if resp_json is None and thinking:
+        resp_json = _extract_json(thinking)
+
+    # Malformed JSON is cheap to fix; a full resummarize is not. Try lenient
+    # repair, then a tight fix-only prompt, before giving up.
+    if resp_json is None and resp_raw.strip():
+        resp_json = await _repair_json(resp_raw, model)
 
     if resp_json is None:
+        if cached is not None:
+            _drop_cached_response(cache_key, cache_dir)
         raise ValueError(
             f"Could not parse JSON from Ollama response. Raw response:\n{resp_raw!r}"
         )
 
+    if store_cache:
+        _store_cached_response(
+            cache_key,
+            {"response": resp_raw, "thinking": thinking},
+            cache_dir,
+        )
+
+    if docx_path:
+        try:
+            notes_json_to_docx(resp_json, docx_path)
+            log(_STAGE, f"DOCX meeting notes saved to {docx_path}")
+        except ImportError:
+            log(_STAGE, "python-docx not installed, skipping DOCX output")
+
     resp_md = notes_json_to_markdown(resp_json)
 
     # This should always return a string in Markdown format
     return resp_md
 
 
+async def ollama_api_notes_many(
+    transcript_paths: list[str],
+    model: str,
+    concurrency: int = 4,
+    **kwargs,
+) -> list[str]:
+    """
+    Generate notes for several transcripts concurrently.
+
+    A semaphore caps in-flight requests; keep concurrency at or below the
+    Ollama server's OLLAMA_NUM_PARALLEL setting, otherwise the extra requests
+    just queue server-side. Prompt-eval and decode phases overlap across
+    requests, so batched multi-meeting runs finish well ahead of serial calls.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(path: str) -> str:
+        async with semaphore:
+            return await ollama_api_notes(path, model, **kwargs)
+
+    return list(await asyncio.gather(*(_one(p) for p in transcript_paths)))
+
+
+async def _repair_json(text: str, model: str) -> dict | None:
+    """Recover a JSON object from a malformed response without resummarizing.
+
+    Tries the lenient json_repair parser if installed, then falls back to a
+    fix-only LLM call with a context sized to the broken output -- orders of
+    magnitude cheaper than re-running the full summarization.
+    """
+    try:
+        import json_repair
+    except ImportError:
+        json_repair = None
+
+    if json_repair is not None:
+        log(_STAGE, "Response was not valid JSON, attempting lenient repair")
+        try:
+            data = json_repair.loads(text)
+            if isinstance(data, dict) and data:
+                return data
+        except ValueError:
+            pass
+
+    log(_STAGE, "Asking the model to fix its malformed JSON output")
+    try:
+        fixed = await _get_async_client().generate(
+            model=model,
+            prompt=f"Fix this to valid JSON. Return only the corrected JSON:\n{text}",
+            keep_alive=_KEEP_ALIVE,
+            options={"num_ctx": min(max(len(text) // 2, 4096), 16000)},
+        )
+        return _extract_json(fixed["response"])
+    except Exception as e:
+        log(_STAGE, f"JSON fix-up call failed: {e}")
+        return None
+
+
+def _strip_markdown_fence(text: str) -> str:
+    """Strip a wrapping code fence (```markdown ... ```) if the model added one."""
+    text = text.strip()
+    if text.startswith("```"):
+        fence_match = _MD_FENCE_RE.search(text)
+        if fence_match:
+            return fence_match.group(1).strip()
+    return text
+
+
 def _extract_json(text: str) -> dict | None:
     """Extract a JSON object from text, handling markdown fences and surrounding prose."""
     if not text or not text.strip():
         return None
 
-    # Strip markdown code fences (```json ... ``` or ``` ... ```)
-    fence_match = re.search(r"```(?:json)?\s*\n?(.*?)```", text, re.DOTALL)
-    if fence_match:
-        text = fence_match.group(1).strip()
-
-    # Try parsing the full text as JSON
+    # Fast path: a well-behaved response parses as-is, no regex needed
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        return _json_loads(text)
+    except ValueError:
         pass
 
-    # Try to find a JSON object ({...}) in the text
-    brace_match = re.search(r"\{.*\}", text, re.DOTALL)
-    if brace_match:
+    # Strip markdown code fences (```json ... ``` or ``` ... ```)
+    fence_match = _FENCE_RE.search(text)
+    if fence_match:
+        try:
+            return _json_loads(fence_match.group(1).strip())
+        except ValueError:
+            pass
+
+    # Last resort: slice from first '{' to last '}' -- cheaper than a
+    # DOTALL regex scan over the whole response
+    start = text.find("{")
+    end = text.rfind("}")
+    if start != -1 and end > start:
         try:
-            return json.loads(brace_match.group(0))
-        except json.JSONDecodeError:
+            return _json_loads(text[start : end + 1])
+        except ValueError:
             pass
 
     return None
@@ -1,6 +1,16 @@
 """Simple stage-based logging for the pipeline."""
 
+import logging
+import sys
+
+_logger = logging.getLogger("lain")
+_logger.setLevel(logging.INFO)
+_handler = logging.StreamHandler(sys.stderr)
+_handler.setFormatter(logging.Formatter("[%(stage)s] %(message)s"))
+_logger.addHandler(_handler)
+_logger.propagate = False
+
 
 def log(stage: str, message: str) -> None:
-    """Print a formatted log message with a stage tag."""
-    print(f"[{stage}] {message}")
+    """Emit a log message tagged with a stage through the module logger."""
+    _logger.info(message, extra={"stage": stage})
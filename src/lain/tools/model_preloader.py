@@ -8,17 +8,29 @@ from lain.tools.log import log
 _STAGE = "Preload"
 
 
+def get_parakeet(model_size: str):
+    """Load a Parakeet-TDT model fresh from the local checkpoint cache.
+
+    Deliberately uncached: callers mutate the model in place (FP16 cast,
+    INT8 quantization, attention reconfiguration), so a shared instance
+    would leak one configuration into the next. lain.transcription caches
+    the configured result per (model_size, compute_type) instead, which is
+    what keeps the weights resident across meetings in a batch run.
+    """
+    import nemo.collections.asr as nemo_asr
+
+    return nemo_asr.models.ASRModel.from_pretrained(
+        model_name=f"nvidia/{model_size}"
+    )
+
+
 def load_parakeet(model_size: str) -> str:
     try:
-        import nemo.collections.asr as nemo_asr
+        get_parakeet(model_size)
     except ImportError as e:
         return f"NeMo ASR not installed: {e}"
 
     device = "cuda" if torch.cuda.is_available() else "cpu"
-    asr_model = nemo_asr.models.ASRModel.from_pretrained(
-        model_name=f"nvidia/{model_size}"
-    )
-
     return f"Parakeet '{model_size}' loaded on device: {device}"
 
 
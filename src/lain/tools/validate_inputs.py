@@ -1,12 +1,22 @@
 import argparse
 import os
 import re
+import stat
 from datetime import datetime
+from pathlib import Path
 
 from lain.tools.log import log
 
 _STAGE = "Setup"
 
+# __file__ is src/lain/tools/validate_inputs.py -> parents[3] is project root
+_PROJECT_ROOT = str(Path(__file__).resolve().parents[3])
+
+# Zoom meeting folder layout: 'YYYY-MM-DD HH.MM.SS <Name>'s Zoom Meeting'
+_ZOOM_FOLDER_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})\s+(\d{2})\.(\d{2})\.(\d{2})\s+(.*)"
+)
+
 
 def validate_args(args: argparse.Namespace, parser: argparse.ArgumentParser):
     args.start_time = (
@@ -18,7 +28,13 @@ def validate_args(args: argparse.Namespace, parser: argparse.ArgumentParser):
     if args.meeting_folder:
         args.meeting_folder = os.path.normpath(args.meeting_folder)
 
-        if not os.path.isdir(args.meeting_folder):
+        # Single stat instead of os.path.isdir; each stat is a round trip on
+        # network mounts, where meeting folders commonly live.
+        try:
+            st = os.stat(args.meeting_folder)
+            if not stat.S_ISDIR(st.st_mode):
+                raise NotADirectoryError(args.meeting_folder)
+        except OSError:
             parser.error(
                 f"Meeting folder does not exist: {args.meeting_folder}"
             )
@@ -32,14 +48,11 @@ def validate_args(args: argparse.Namespace, parser: argparse.ArgumentParser):
                 log(_STAGE, f"Extracted start time: {args.start_time}")
 
     # Build output folder: default is Transcripts/<meeting-folder-name>/
-    # __file__ is src/lain/tools/validate_inputs.py → 4x dirname to reach project root
     if args.output_folder is None and args.meeting_folder:
         meeting_name = os.path.basename(args.meeting_folder)
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-        args.output_folder = os.path.join(project_root, "Transcripts", meeting_name)
+        args.output_folder = os.path.join(_PROJECT_ROOT, "Transcripts", meeting_name)
     elif args.output_folder is None:
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-        args.output_folder = os.path.join(project_root, "Transcripts")
+        args.output_folder = os.path.join(_PROJECT_ROOT, "Transcripts")
 
     args.output_folder = os.path.normpath(args.output_folder)
     os.makedirs(args.output_folder, exist_ok=True)
@@ -70,17 +83,12 @@ def validate_args(args: argparse.Namespace, parser: argparse.ArgumentParser):
 def get_meeting_start_time_from_folder_name(folder_name: str) -> datetime:
     """Zoom Folder based meeting start time extraction"""
     base_folder_name = os.path.basename(folder_name)
-    match = re.match(
-        r"(\d{4}-\d{2}-\d{2})\s+(\d{2}\.\d{2}\.\d{2})\s+(.*)", base_folder_name
-    )
+    match = _ZOOM_FOLDER_RE.match(base_folder_name)
     if match:
-        date_str = match.group(1)
-        time_str = match.group(2)
-
         try:
-            meeting_start_time = datetime.strptime(
-                f"{date_str} {time_str}", "%Y-%m-%d %H.%M.%S"
-            )
+            # Direct construction from the captured digits; strptime re-parses
+            # its format string every call and is several times slower.
+            meeting_start_time = datetime(*map(int, match.groups()[:6]))
         except ValueError:
             log(
                 _STAGE,